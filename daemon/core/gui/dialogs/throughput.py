@@ -109,4 +109,6 @@ class ThroughputDialog(Dialog):
         self.manager.throughput_threshold = self.threshold.get()
         self.manager.throughput_width = self.width.get()
         self.manager.throughput_color = self.color
+        for canvas in self.manager.all():
+            canvas.update_throughput_style()
         self.destroy()
@@ -42,13 +42,12 @@ class WlanConfigDialog(Dialog):
             self.destroy()
 
     def init_draw_range(self) -> None:
-        if self.canvas_node.id in self.canvas.wireless_network:
-            for cid in self.canvas.wireless_network[self.canvas_node.id]:
-                x, y = self.canvas.coords(cid)
-                range_id = self.canvas.create_oval(
-                    x, y, x, y, width=RANGE_WIDTH, outline=RANGE_COLOR, tags="range"
-                )
-                self.ranges[cid] = range_id
+        for cid in self.canvas.wireless_network.get(self.canvas_node.id, ()):
+            x, y = self.canvas.coords(cid)
+            range_id = self.canvas.create_oval(
+                x, y, x, y, width=RANGE_WIDTH, outline=RANGE_COLOR, tags="range"
+            )
+            self.ranges[cid] = range_id
 
     def draw(self) -> None:
         self.top.columnconfigure(0, weight=1)
@@ -106,16 +105,15 @@ class WlanConfigDialog(Dialog):
             int_value = int(s) / 2
             if int_value >= 0:
                 net_range = int_value * self.canvas.ratio
-                if self.canvas_node.id in self.canvas.wireless_network:
-                    for cid in self.canvas.wireless_network[self.canvas_node.id]:
-                        x, y = self.canvas.coords(cid)
-                        self.canvas.coords(
-                            self.ranges[cid],
-                            x - net_range,
-                            y - net_range,
-                            x + net_range,
-                            y + net_range,
-                        )
+                for cid in self.canvas.wireless_network.get(self.canvas_node.id, ()):
+                    x, y = self.canvas.coords(cid)
+                    self.canvas.coords(
+                        self.ranges[cid],
+                        x - net_range,
+                        y - net_range,
+                        x + net_range,
+                        y + net_range,
+                    )
                 return True
             return False
         except ValueError:
@@ -5,7 +5,7 @@ import tkinter as tk
 from typing import TYPE_CHECKING, Optional, Union
 
 from core.api.grpc.wrappers import Interface, Link
-from core.gui import nodeutils, themes
+from core.gui import nodeutils
 from core.gui.dialogs.linkconfig import LinkConfigurationDialog
 from core.gui.frames.link import EdgeInfoFrame, WirelessEdgeInfoFrame
 from core.gui.graph import tags
@@ -40,16 +40,9 @@ def create_edge_token(link: Link) -> str:
     iface1_id = link.iface1.id if link.iface1 else 0
     iface2_id = link.iface2.id if link.iface2 else 0
     if link.node1_id < link.node2_id:
-        node1 = link.node1_id
-        node1_iface = iface1_id
-        node2 = link.node2_id
-        node2_iface = iface2_id
+        return f"{link.node1_id}-{iface1_id}-{link.node2_id}-{iface2_id}"
     else:
-        node1 = link.node2_id
-        node1_iface = iface2_id
-        node2 = link.node1_id
-        node2_iface = iface1_id
-    return f"{node1}-{node1_iface}-{node2}-{node2_iface}"
+        return f"{link.node2_id}-{iface2_id}-{link.node1_id}-{iface1_id}"
 
 
 def node_label_positions(
@@ -65,6 +58,51 @@ def node_label_positions(
     return (src_x + offset_x, src_y + offset_y), (dst_x - offset_x, dst_y - offset_y)
 
 
+@functools.lru_cache(maxsize=4096)
+def format_iface_label(
+    name: Optional[str],
+    ip4: Optional[str],
+    ip4_mask: Optional[int],
+    ip6: Optional[str],
+    ip6_mask: Optional[int],
+    show_name: bool,
+    show_ip4: bool,
+    show_ip6: bool,
+) -> str:
+    label = ""
+    if name and show_name:
+        label = f"{name}"
+    if ip4 and show_ip4:
+        label = f"{label}\n" if label else ""
+        label += f"{ip4}/{ip4_mask}"
+    if ip6 and show_ip6:
+        label = f"{label}\n" if label else ""
+        label += f"{ip6}/{ip6_mask}"
+    return label
+
+
+def arc_point(
+    src_pos: tuple[float, float], dst_pos: tuple[float, float], arc: float
+) -> tuple[float, float]:
+    src_x, src_y = src_pos
+    dst_x, dst_y = dst_pos
+    mp_x = (src_x + dst_x) / 2
+    mp_y = (src_y + dst_y) / 2
+    v_x, v_y = src_x - dst_x, src_y - dst_y
+    # vertical line
+    if v_x == 0:
+        return mp_x + arc, mp_y
+    # horizontal line
+    if v_y == 0:
+        return mp_x, mp_y + arc
+    # everything else, offset along the perpendicular, keeping positive arcs
+    # on the side of increasing x
+    scale = arc / math.hypot(v_x, v_y)
+    if v_y < 0:
+        scale = -scale
+    return mp_x + scale * v_y, mp_y - scale * v_x
+
+
 def arc_edges(edges) -> None:
     if not edges:
         return
@@ -95,6 +133,29 @@ def arc_edges(edges) -> None:
 
 
 class Edge:
+    __slots__ = (
+        "app",
+        "manager",
+        "id",
+        "id2",
+        "src",
+        "src_shadow",
+        "dst",
+        "dst_shadow",
+        "link",
+        "arc",
+        "token",
+        "src_label",
+        "src_label2",
+        "middle_label",
+        "middle_label2",
+        "dst_label",
+        "dst_label2",
+        "color",
+        "width",
+        "linked_wireless",
+        "hidden",
+    )
     tag: str = tags.EDGE
 
     def __init__(
@@ -125,36 +186,12 @@ class Edge:
             self.linked_wireless = self.src.is_wireless() or self.dst.is_wireless()
 
     def scaled_width(self) -> float:
-        return self.width * self.app.app_scale
+        return self.width * self.src.canvas.edge_scale
 
     def _get_arcpoint(
         self, src_pos: tuple[float, float], dst_pos: tuple[float, float]
     ) -> tuple[float, float]:
-        src_x, src_y = src_pos
-        dst_x, dst_y = dst_pos
-        mp_x = (src_x + dst_x) / 2
-        mp_y = (src_y + dst_y) / 2
-        slope_denominator = src_x - dst_x
-        slope_numerator = src_y - dst_y
-        # vertical line
-        if slope_denominator == 0:
-            return mp_x + self.arc, mp_y
-        # horizontal line
-        if slope_numerator == 0:
-            return mp_x, mp_y + self.arc
-        # everything else
-        m = slope_numerator / slope_denominator
-        perp_m = -1 / m
-        b = mp_y - (perp_m * mp_x)
-        # get arc x and y
-        offset = math.sqrt(self.arc**2 / (1 + (1 / m**2)))
-        arc_x = mp_x
-        if self.arc >= 0:
-            arc_x += offset
-        else:
-            arc_x -= offset
-        arc_y = (perp_m * arc_x) + b
-        return arc_x, arc_y
+        return arc_point(src_pos, dst_pos, self.arc)
 
     def arc_common_edges(self) -> None:
         common_edges = list(self.src.edges & self.dst.edges)
@@ -214,12 +251,11 @@ class Edge:
         )
 
     def redraw(self) -> None:
-        self.src.canvas.itemconfig(self.id, width=self.scaled_width(), fill=self.color)
+        width = self.scaled_width()
+        self.src.canvas.itemconfig(self.id, width=width, fill=self.color)
         self.move_src()
         if self.id2:
-            self.dst.canvas.itemconfig(
-                self.id2, width=self.scaled_width(), fill=self.color
-            )
+            self.dst.canvas.itemconfig(self.id2, width=width, fill=self.color)
             self.move_dst()
 
     def middle_label_text(self, text: str) -> None:
@@ -257,8 +293,11 @@ class Edge:
             self.dst.canvas.delete(self.middle_label2)
             self.middle_label2 = None
 
-    def src_label_text(self, text: str) -> None:
+    def src_label_text(self, text: Optional[str]) -> None:
         if self.src_label is None and self.src_label2 is None:
+            # no interface to label, avoid creating empty text items
+            if text is None:
+                return
             if self.id:
                 src_x, src_y, _, _, dst_x, dst_y = self.src.canvas.coords(self.id)
                 src_pos, _ = node_label_positions(src_x, src_y, dst_x, dst_y)
@@ -287,8 +326,11 @@ class Edge:
             if self.src_label2:
                 self.dst.canvas.itemconfig(self.src_label2, text=text)
 
-    def dst_label_text(self, text: str) -> None:
+    def dst_label_text(self, text: Optional[str]) -> None:
         if self.dst_label is None and self.dst_label2 is None:
+            # no interface to label, avoid creating empty text items
+            if text is None:
+                return
             if self.id:
                 src_x, src_y, _, _, dst_x, dst_y = self.src.canvas.coords(self.id)
                 _, dst_pos = node_label_positions(src_x, src_y, dst_x, dst_y)
@@ -349,7 +391,7 @@ class Edge:
         self.moved(src_pos, self.dst_shadow.position())
 
     def move_dst(self) -> None:
-        if self.dst.is_wireless() and self.has_shadows():
+        if self.has_shadows() and self.dst.is_wireless():
             return
         dst_pos = self.dst.position()
         if self.id2:
@@ -370,29 +412,31 @@ class Edge:
 
     def moved(self, src_pos: tuple[float, float], dst_pos: tuple[float, float]) -> None:
         arc_pos = self._get_arcpoint(src_pos, dst_pos)
-        self.src.canvas.coords(self.id, *src_pos, *arc_pos, *dst_pos)
+        updates = [(self.id, (*src_pos, *arc_pos, *dst_pos))]
         if self.middle_label:
-            self.src.canvas.coords(self.middle_label, *arc_pos)
-        src_x, src_y, _, _, dst_x, dst_y = self.src.canvas.coords(self.id)
-        src_pos, dst_pos = node_label_positions(src_x, src_y, dst_x, dst_y)
-        if self.src_label:
-            self.src.canvas.coords(self.src_label, *src_pos)
-        if self.dst_label:
-            self.src.canvas.coords(self.dst_label, *dst_pos)
+            updates.append((self.middle_label, arc_pos))
+        if self.src_label or self.dst_label:
+            src_pos, dst_pos = node_label_positions(*src_pos, *dst_pos)
+            if self.src_label:
+                updates.append((self.src_label, src_pos))
+            if self.dst_label:
+                updates.append((self.dst_label, dst_pos))
+        self.src.canvas.coords_many(updates)
 
     def moved2(
         self, src_pos: tuple[float, float], dst_pos: tuple[float, float]
     ) -> None:
         arc_pos = self._get_arcpoint(src_pos, dst_pos)
-        self.dst.canvas.coords(self.id2, *src_pos, *arc_pos, *dst_pos)
+        updates = [(self.id2, (*src_pos, *arc_pos, *dst_pos))]
         if self.middle_label2:
-            self.dst.canvas.coords(self.middle_label2, *arc_pos)
-        src_x, src_y, _, _, dst_x, dst_y = self.dst.canvas.coords(self.id2)
-        src_pos, dst_pos = node_label_positions(src_x, src_y, dst_x, dst_y)
-        if self.src_label2:
-            self.dst.canvas.coords(self.src_label2, *src_pos)
-        if self.dst_label2:
-            self.dst.canvas.coords(self.dst_label2, *dst_pos)
+            updates.append((self.middle_label2, arc_pos))
+        if self.src_label2 or self.dst_label2:
+            src_pos, dst_pos = node_label_positions(*src_pos, *dst_pos)
+            if self.src_label2:
+                updates.append((self.src_label2, src_pos))
+            if self.dst_label2:
+                updates.append((self.dst_label2, dst_pos))
+        self.dst.canvas.coords_many(updates)
 
     def delete(self) -> None:
         logger.debug("deleting canvas edge, id: %s", self.id)
@@ -481,6 +525,7 @@ class Edge:
 
 
 class CanvasWirelessEdge(Edge):
+    __slots__ = ("network_id",)
     tag = tags.WIRELESS_EDGE
 
     def __init__(
@@ -530,6 +575,14 @@ class CanvasEdge(Edge):
     Canvas edge class
     """
 
+    __slots__ = (
+        "text_src",
+        "text_dst",
+        "asymmetric_link",
+        "throughput",
+        "throughput_style",
+    )
+
     def __init__(
         self, app: "Application", src: "CanvasNode", dst: "CanvasNode" = None
     ) -> None:
@@ -541,6 +594,7 @@ class CanvasEdge(Edge):
         self.text_dst: Optional[int] = None
         self.asymmetric_link: Optional[Link] = None
         self.throughput: Optional[float] = None
+        self.throughput_style: Optional[tuple[str, float]] = None
         self.draw(tk.NORMAL)
 
     def is_customized(self) -> bool:
@@ -557,18 +611,18 @@ class CanvasEdge(Edge):
             self.dst.canvas.tag_bind(self.id2, "<Button-1>", self.show_info)
 
     def iface_label(self, iface: Interface) -> str:
-        label = ""
-        if iface.name and self.manager.show_iface_names.get():
-            label = f"{iface.name}"
-        if iface.ip4 and self.manager.show_ip4s.get():
-            label = f"{label}\n" if label else ""
-            label += f"{iface.ip4}/{iface.ip4_mask}"
-        if iface.ip6 and self.manager.show_ip6s.get():
-            label = f"{label}\n" if label else ""
-            label += f"{iface.ip6}/{iface.ip6_mask}"
-        return label
-
-    def create_node_labels(self) -> tuple[str, str]:
+        return format_iface_label(
+            iface.name,
+            iface.ip4,
+            iface.ip4_mask,
+            iface.ip6,
+            iface.ip6_mask,
+            self.manager.show_iface_names.get(),
+            self.manager.show_ip4s.get(),
+            self.manager.show_ip6s.get(),
+        )
+
+    def create_node_labels(self) -> tuple[Optional[str], Optional[str]]:
         label1 = None
         if self.link.iface1:
             label1 = self.iface_label(self.link.iface1)
@@ -586,6 +640,7 @@ class CanvasEdge(Edge):
 
     def redraw(self) -> None:
         super().redraw()
+        self.throughput_style = None
         self.draw_labels()
 
     def show(self) -> None:
@@ -612,11 +667,14 @@ class CanvasEdge(Edge):
         text = f"{throughput:.3f} kbps"
         self.middle_label_text(text)
         if throughput > self.manager.throughput_threshold:
-            color = self.manager.throughput_color
-            width = self.manager.throughput_width
+            style = self.src.canvas.throughput_edge_style
         else:
-            color = self.color
-            width = self.scaled_width()
+            style = self.color, self.scaled_width()
+        # avoid reconfiguring lines that already have the desired style
+        if style == self.throughput_style:
+            return
+        self.throughput_style = style
+        color, width = style
         self.src.canvas.itemconfig(self.id, fill=color, width=width)
         if self.id2:
             self.dst.canvas.itemconfig(self.id2, fill=color, width=width)
@@ -668,9 +726,11 @@ class CanvasEdge(Edge):
             self.dst.canvas.itemconfig(self.id2, state=tk.HIDDEN)
             self.dst.canvas.dtag(self.id2, tags.EDGE)
         # add antenna to node
-        if self.src.is_wireless() and not self.dst.is_wireless():
+        src_wireless = self.src.is_wireless()
+        dst_wireless = self.dst.is_wireless()
+        if src_wireless and not dst_wireless:
             self.dst.add_antenna()
-        elif not self.src.is_wireless() and self.dst.is_wireless():
+        elif not src_wireless and dst_wireless:
             self.src.add_antenna()
         else:
             self.src.add_antenna()
@@ -682,26 +742,19 @@ class CanvasEdge(Edge):
         if self.middle_label2:
             self.dst.canvas.delete(self.middle_label2)
             self.middle_label2 = None
+        width = self.scaled_width()
         if self.id:
-            self.src.canvas.itemconfig(
-                self.id, fill=self.color, width=self.scaled_width()
-            )
+            self.src.canvas.itemconfig(self.id, fill=self.color, width=width)
         if self.id2:
-            self.dst.canvas.itemconfig(
-                self.id2, fill=self.color, width=self.scaled_width()
-            )
+            self.dst.canvas.itemconfig(self.id2, fill=self.color, width=width)
+        self.throughput_style = self.color, width
 
     def show_info(self, _event: tk.Event) -> None:
         self.app.display_info(EdgeInfoFrame, app=self.app, edge=self)
 
     def show_context(self, canvas: "CanvasGraph", event: tk.Event) -> None:
-        context: tk.Menu = tk.Menu(canvas)
-        themes.style_menu(context)
-        context.add_command(label="Configure", command=self.click_configure)
-        context.add_command(label="Delete", command=self.click_delete)
-        state = tk.DISABLED if self.app.core.is_runtime() else tk.NORMAL
-        context.entryconfigure(1, state=state)
-        context.tk_popup(event.x_root, event.y_root)
+        canvas.context_edge = self
+        canvas.edge_context.tk_popup(event.x_root, event.y_root)
 
     def click_delete(self) -> None:
         self.delete()
@@ -8,7 +8,7 @@ from PIL import Image
 from PIL.ImageTk import PhotoImage
 
 from core.api.grpc.wrappers import Interface, Link
-from core.gui import appconfig
+from core.gui import appconfig, themes
 from core.gui import nodeutils as nutils
 from core.gui.dialogs.shapemod import ShapeDialog
 from core.gui.graph import tags
@@ -59,6 +59,7 @@ class CanvasGraph(tk.Canvas):
         self.wireless_network: dict[int, set[int]] = {}
 
         self.drawing_edge: Optional[CanvasEdge] = None
+        self.context_edge: Optional[CanvasEdge] = None
         self.rect: Optional[int] = None
         self.shape_drawing: bool = False
         self.current_dimensions: tuple[int, int] = dimensions
@@ -75,6 +76,22 @@ class CanvasGraph(tk.Canvas):
         self.scale_option: tk.IntVar = tk.IntVar(value=1)
         self.adjust_to_dim: tk.BooleanVar = tk.BooleanVar(value=False)
 
+        # edge styles, refreshed by scale_graph() and update_throughput_style()
+        self.edge_scale: float = app.app_scale
+        self.throughput_edge_style: tuple[str, int] = (
+            manager.throughput_color,
+            manager.throughput_width,
+        )
+
+        # shared edge context menu, acting on the current context edge
+        self.edge_context: tk.Menu = tk.Menu(self)
+        themes.style_menu(self.edge_context)
+        self.edge_context.add_command(
+            label="Configure", command=self.click_edge_configure
+        )
+        self.edge_context.add_command(label="Delete", command=self.click_edge_delete)
+        self.set_edge_context_state(self.core.is_runtime())
+
         # bindings
         self.setup_bindings()
 
@@ -120,6 +137,20 @@ class CanvasGraph(tk.Canvas):
         self.bind("<ButtonPress-3>", lambda e: self.scan_mark(e.x, e.y))
         self.bind("<B3-Motion>", lambda e: self.scan_dragto(e.x, e.y, gain=1))
 
+    def set_edge_context_state(self, is_runtime: bool) -> None:
+        state = tk.DISABLED if is_runtime else tk.NORMAL
+        self.edge_context.entryconfigure("Delete", state=state)
+
+    def click_edge_configure(self) -> None:
+        if self.context_edge:
+            self.context_edge.click_configure()
+            self.context_edge = None
+
+    def click_edge_delete(self) -> None:
+        if self.context_edge:
+            self.context_edge.click_delete()
+            self.context_edge = None
+
     def get_shadow(self, node: CanvasNode) -> ShadowNode:
         shadow_node = self.shadow_core_nodes.get(node.core_node.id)
         if not shadow_node:
@@ -639,6 +670,16 @@ class CanvasGraph(tk.Canvas):
                 logger.warning("tiled background not implemented yet")
         self.organize()
 
+    def coords_many(self, updates: list[tuple[int, tuple[float, ...]]]) -> None:
+        """
+        Set coordinates for multiple items within a single Tcl evaluation
+        """
+        script = "\n".join(
+            f"{self} coords {item_id} {' '.join(map(str, coords))}"
+            for item_id, coords in updates
+        )
+        self.tk.eval(script)
+
     def organize(self) -> None:
         for tag in tags.ORGANIZE_TAGS:
             self.tag_raise(tag)
@@ -804,15 +845,26 @@ class CanvasGraph(tk.Canvas):
             )
         self.tag_raise(tags.NODE)
 
+    def update_throughput_style(self) -> None:
+        self.throughput_edge_style = (
+            self.manager.throughput_color,
+            self.manager.throughput_width,
+        )
+
     def scale_graph(self) -> None:
+        # cached edge styles are stale once the scale changes
+        self.edge_scale = self.app.app_scale
         for node_id, canvas_node in self.nodes.items():
             image = nutils.get_icon(canvas_node.core_node, self.app)
             self.itemconfig(node_id, image=image)
             canvas_node.image = image
             canvas_node.scale_text()
             canvas_node.scale_antennas()
+            for edge in canvas_node.edges:
+                edge.throughput_style = None
+        edge_width = int(EDGE_WIDTH * self.edge_scale)
         for edge_id in self.find_withtag(tags.EDGE):
-            self.itemconfig(edge_id, width=int(EDGE_WIDTH * self.app.app_scale))
+            self.itemconfig(edge_id, width=edge_width)
 
     def get_metadata(self) -> dict[str, Any]:
         wallpaper_path = None
@@ -393,11 +393,11 @@ class CanvasManager:
 
     def add_wired_edge(self, src: CanvasNode, dst: CanvasNode, link: Link) -> None:
         token = create_edge_token(link)
-        if token in self.edges and link.options.unidirectional:
-            edge = self.edges[token]
+        edge = self.edges.get(token)
+        if edge and link.options.unidirectional:
             edge.asymmetric_link = link
             edge.redraw()
-        elif token not in self.edges:
+        elif not edge:
             edge = CanvasEdge(self.app, src, dst)
             edge.complete(dst, link)
 
@@ -415,10 +415,9 @@ class CanvasManager:
     ) -> None:
         network_id = link.network_id if link.network_id else None
         token = create_wireless_token(src.id, dst.id, network_id)
-        if token not in self.wireless_edges:
-            return
-        edge = self.wireless_edges.pop(token)
-        edge.delete()
+        edge = self.wireless_edges.pop(token, None)
+        if edge:
+            edge.delete()
 
     def update_wireless_edge(
         self, src: CanvasNode, dst: CanvasNode, link: Link
@@ -427,8 +426,8 @@ class CanvasManager:
             return
         network_id = link.network_id if link.network_id else None
         token = create_wireless_token(src.id, dst.id, network_id)
-        if token not in self.wireless_edges:
+        edge = self.wireless_edges.get(token)
+        if not edge:
             self.add_wireless_edge(src, dst, link)
         else:
-            edge = self.wireless_edges[token]
             edge.middle_label_text(link.label)
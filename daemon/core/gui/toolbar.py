@@ -313,12 +313,16 @@ class Toolbar(ttk.Frame):
             )
 
     def set_runtime(self) -> None:
+        for canvas in self.app.manager.all():
+            canvas.set_edge_context_state(is_runtime=True)
         enable_buttons(self.runtime_frame, enabled=True)
         self.runtime_frame.tkraise()
         self.click_runtime_selection()
         self.hide_marker()
 
     def set_design(self) -> None:
+        for canvas in self.app.manager.all():
+            canvas.set_edge_context_state(is_runtime=False)
         enable_buttons(self.design_frame, enabled=True)
         self.design_frame.tkraise()
         self.click_selection()